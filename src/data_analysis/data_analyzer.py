@@ -2,15 +2,22 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field, fields
+from functools import cached_property
 from datetime import date
 from pathlib import Path
 from collections import defaultdict
-from typing import Iterable, Dict, List, Optional
+from typing import Iterable, Iterator, Dict, List, Optional, Tuple, Union
+from operator import itemgetter
 import csv
+import heapq
+import logging
+import sys
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class SalesRecord:
     order_id: str
     date: date
@@ -19,47 +26,297 @@ class SalesRecord:
     category: str
     quantity: int
     unit_price: float
+    # Derived from quantity * unit_price once, at construction
+    line_revenue: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "line_revenue", self.quantity * self.unit_price)
 
-    @property
-    def line_revenue(self) -> float:
-        return self.quantity * self.unit_price
 
+# order_id, date, region, product, category, quantity, unit_price
+_SalesRow = Tuple[str, date, str, str, str, int, float]
 
-def load_sales(csv_path: Path) -> List[SalesRecord]:
+# Header names of the CSV columns, in _SalesRow order
+_CSV_COLUMNS = (
+    "order_id",
+    "date",
+    "region",
+    "product",
+    "category",
+    "quantity",
+    "unit_price",
+)
+
+
+def _read_sales_rows(csv_path: Path) -> Iterator[_SalesRow]:
     """
-    Load sales data from a CSV file.
-    Uses csv.DictReader and functional-style processing.
+    Parse a sales CSV file into plain tuples.
+    Uses csv.reader with columns picked by header position.
+    Raises ValueError if the header lacks any required column.
     """
-    records: List[SalesRecord] = []
-
     with csv_path.open(newline="") as f:
-        reader = csv.DictReader(f)
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return
+
+        idx = {name: i for i, name in enumerate(header)}
+        missing = [name for name in _CSV_COLUMNS if name not in idx]
+        if missing:
+            raise ValueError(f"{csv_path} is missing columns: {', '.join(missing)}")
+        pick = itemgetter(*(idx[name] for name in _CSV_COLUMNS))
+
+        # Local names avoid a global lookup per row
+        parse_date = date.fromisoformat
+        to_int = int
+        to_float = float
+        # Regions, products and categories repeat heavily; interning makes
+        # later dict lookups on them compare by identity
+        intern = sys.intern
 
         for row in reader:
+            # csv.reader yields [] for blank lines, e.g. a trailing newline
+            if not row:
+                continue
+
             try:
-                yield SalesRecord(
-                    order_id=row["order_id"],
-                    date=date.fromisoformat(row["date"]),
-                    region=row["region"],
-                    product=row["product"],
-                    category=row["category"],
-                    quantity=int(row["quantity"]),
-                    unit_price=float(row["unit_price"]),
-                )
-            except Exception as e:
-                print(f"Skipping malformed row {row}: {e}")
+                order_id, d, region, product, category, qty, price = pick(row)
+                parsed_date = parse_date(d)
+                quantity = to_int(qty)
+                unit_price = to_float(price)
+            except (IndexError, ValueError) as e:
+                logger.warning("Skipping malformed row %s: %s", row, e)
+                continue
+
+            yield (
+                order_id,
+                parsed_date,
+                intern(region),
+                intern(product),
+                intern(category),
+                quantity,
+                unit_price,
+            )
+
+
+def load_sales(csv_path: Path) -> Iterator[SalesRecord]:
+    """
+    Lazily load sales data from a CSV file.
+    Each parsed row is wrapped in a SalesRecord; malformed rows are skipped.
+    """
+    rows = _read_sales_rows(csv_path)
+    for order_id, d, region, product, category, quantity, unit_price in rows:
+        yield SalesRecord(
+            order_id=order_id,
+            date=d,
+            region=region,
+            product=product,
+            category=category,
+            quantity=quantity,
+            unit_price=unit_price,
+        )
+
+
+def _encode(value: str, index: Dict[str, int], values: List[str]) -> int:
+    """
+    Return the integer code of value, assigning the next free code
+    (and recording the value) the first time it is seen.
+    """
+    code = index.get(value)
+    if code is None:
+        code = index[value] = len(values)
+        values.append(value)
+    return code
+
+
+@dataclass
+class SalesColumns:
+    """
+    Column-oriented (struct-of-arrays) view of sales records.
+    Each per-row field is a flat list holding one column, all of equal length.
+    Region, product and category are stored as integer codes into the
+    regions, products and categories lists (distinct values in first-seen
+    order), so groupings can accumulate into lists indexed by code.
+    """
+    order_id: List[str] = field(default_factory=list)
+    date: List[date] = field(default_factory=list)
+    region_code: List[int] = field(default_factory=list)
+    product_code: List[int] = field(default_factory=list)
+    category_code: List[int] = field(default_factory=list)
+    quantity: List[int] = field(default_factory=list)
+    unit_price: List[float] = field(default_factory=list)
+    revenue: List[float] = field(default_factory=list)
+    regions: List[str] = field(default_factory=list)
+    products: List[str] = field(default_factory=list)
+    categories: List[str] = field(default_factory=list)
+
+    # value -> code lookups used while appending
+    _region_index: Dict[str, int] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _product_index: Dict[str, int] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _category_index: Dict[str, int] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        """
+        Validate columns passed to the constructor and rebuild the
+        value -> code lookups, so later appends reuse existing codes.
+        """
+        lengths = {
+            len(column)
+            for column in (
+                self.order_id,
+                self.date,
+                self.region_code,
+                self.product_code,
+                self.category_code,
+                self.quantity,
+                self.unit_price,
+                self.revenue,
+            )
+        }
+        if len(lengths) > 1:
+            raise ValueError("All per-row columns must have the same length")
+
+        for name, codes, values, index_attr in (
+            ("regions", self.region_code, self.regions, "_region_index"),
+            ("products", self.product_code, self.products, "_product_index"),
+            ("categories", self.category_code, self.categories, "_category_index"),
+        ):
+            index = {value: code for code, value in enumerate(values)}
+            if len(index) != len(values):
+                raise ValueError(f"{name} must not contain duplicate values")
+            if codes and not 0 <= min(codes) <= max(codes) < len(values):
+                raise ValueError(f"Codes for {name} must index into {name}")
+            setattr(self, index_attr, index)
+
+    def append(
+        self,
+        order_id: str,
+        d: date,
+        region: str,
+        product: str,
+        category: str,
+        quantity: int,
+        unit_price: float,
+    ) -> None:
+        """
+        Append one row, encoding its categorical fields.
+        Line revenue is computed once here rather than on every aggregation.
+        """
+        self.order_id.append(order_id)
+        self.date.append(d)
+        self.region_code.append(_encode(region, self._region_index, self.regions))
+        self.product_code.append(_encode(product, self._product_index, self.products))
+        self.category_code.append(
+            _encode(category, self._category_index, self.categories)
+        )
+        self.quantity.append(quantity)
+        self.unit_price.append(unit_price)
+        self.revenue.append(quantity * unit_price)
+
+    def copy(self) -> SalesColumns:
+        """
+        Return an independent copy; appending to either leaves the other unchanged.
+        """
+        return SalesColumns(
+            **{f.name: list(getattr(self, f.name)) for f in fields(self) if f.init}
+        )
+
+    @classmethod
+    def from_records(cls, records: Iterable[SalesRecord]) -> SalesColumns:
+        """
+        Build the columns in a single pass over the records.
+        """
+        cols = cls()
+        for r in records:
+            cols.append(
+                r.order_id,
+                r.date,
+                r.region,
+                r.product,
+                r.category,
+                r.quantity,
+                r.unit_price,
+            )
+        return cols
+
+
+def load_sales_columns(csv_path: Path) -> SalesColumns:
+    """
+    Load sales data from a CSV file straight into columns.
+    Skips building a SalesRecord per row, which dominates bulk loads.
+    """
+    cols = SalesColumns()
+    rows = _read_sales_rows(csv_path)
+    for order_id, d, region, product, category, quantity, unit_price in rows:
+        cols.append(order_id, d, region, product, category, quantity, unit_price)
+    return cols
 
-    return records
+
+@dataclass
+class _GroupTotals:
+    region_revenue: Dict[str, float]
+    product_revenue: Dict[str, float]
+    product_quantity: Dict[str, int]
+    category_quantity: Dict[str, int]
 
 
 class SalesDataAnalyzer:
     """
-    Performs various aggregation and grouping operations using
-    functional constructs in Python.
+    Performs various aggregation and grouping operations over
+    column-oriented sales data. Groupings are explicit loops over
+    zipped columns, computed once and cached per analyzer.
     """
 
-    def __init__(self, records: Iterable[SalesRecord]) -> None:
-        self.records: List[SalesRecord] = list(records)
+    def __init__(self, records: Union[SalesColumns, Iterable[SalesRecord]]) -> None:
+        if isinstance(records, SalesColumns):
+            # Snapshot the caller's columns so later appends to them cannot
+            # make the memoized results disagree with each other
+            self.columns: SalesColumns = records.copy()
+        else:
+            self.columns = SalesColumns.from_records(records)
+
+    @classmethod
+    def from_csv(cls, csv_path: Path) -> SalesDataAnalyzer:
+        """
+        Build an analyzer directly from a CSV file.
+        Rows are parsed straight into the columns.
+        """
+        return cls(load_sales_columns(csv_path))
+
+    @cached_property
+    def records(self) -> List[SalesRecord]:
+        """
+        The rows as SalesRecord objects, rebuilt from the columns on
+        first access only; the aggregations never need them.
+        """
+        cols = self.columns
+        regions, products, categories = cols.regions, cols.products, cols.categories
+        return [
+            SalesRecord(
+                order_id=order_id,
+                date=d,
+                region=regions[rc],
+                product=products[pc],
+                category=categories[cc],
+                quantity=quantity,
+                unit_price=unit_price,
+            )
+            for order_id, d, rc, pc, cc, quantity, unit_price in zip(
+                cols.order_id,
+                cols.date,
+                cols.region_code,
+                cols.product_code,
+                cols.category_code,
+                cols.quantity,
+                cols.unit_price,
+            )
+        ]
 
     # ---------- Aggregation / grouping methods ----------
 
@@ -67,93 +324,176 @@ class SalesDataAnalyzer:
         """
         Returns the total revenue.
         """
-        return sum(r.line_revenue for r in self.records)
+        return self._total_revenue
 
     def revenue_by_region(self) -> Dict[str, float]:
         """
         Returns the revenue by region.
         """
-        totals: Dict[str, float] = defaultdict(float)
-        for r in self.records:
-            totals[r.region] += r.line_revenue
-        return dict(totals)
+        return dict(self._group_totals.region_revenue)
 
     def revenue_by_product(self) -> Dict[str, float]:
         """
         Returns the revenue by product.
         """
-        totals: Dict[str, float] = defaultdict(float)
-        for r in self.records:
-            totals[r.product] += r.line_revenue
-        return dict(totals)
+        return dict(self._group_totals.product_revenue)
 
     def quantity_by_category(self) -> Dict[str, int]:
         """
         Returns the quantity by category.
         """
-        totals: Dict[str, int] = defaultdict(int)
-        for r in self.records:
-            totals[r.category] += r.quantity
-        return dict(totals)
+        return dict(self._group_totals.category_quantity)
 
     def average_order_value_by_date(self) -> Dict[date, float]:
         """
         Returns the average order value by date.
         """
-        # date -> order_id -> list[SalesRecord]
-        by_date_then_order: Dict[date, Dict[str, List[SalesRecord]]] = defaultdict(
-            lambda: defaultdict(list)
-        )
-
-        for r in self.records:
-            by_date_then_order[r.date][r.order_id].append(r)
-
-        result: Dict[date, float] = {}
-
-        for d, orders in by_date_then_order.items():
-            order_totals = [
-                sum(line.line_revenue for line in order_lines)
-                for order_lines in orders.values()
-            ]
-            avg = (
-                sum(order_totals) / len(order_totals)
-                if order_totals
-                else 0.0
-            )
-            result[d] = avg
-
-        return result
+        return dict(self._average_order_value_by_date)
 
     def top_n_products_by_revenue(self, n: int) -> List[tuple[str, float]]:
         """
         Returns the top n products by revenue.
+        Raises ValueError if n is negative.
         """
-        items = list(self.revenue_by_product().items())
-        items.sort(key=lambda kv: kv[1], reverse=True)
-        return items[:n]
+        if n < 0:
+            raise ValueError("n must not be negative")
+
+        # Partial selection: O(P log n) instead of sorting every product
+        return heapq.nlargest(
+            n, self._group_totals.product_revenue.items(), key=itemgetter(1)
+        )
 
     def revenue_by_region_then_category(self) -> Dict[str, Dict[str, float]]:
         """
         Returns the revenue by region then category.
         """
-        nested: Dict[str, Dict[str, float]] = defaultdict(lambda: defaultdict(float))
-
-        for r in self.records:
-            nested[r.region][r.category] += r.line_revenue
-
-        # convert default dicts to plain dicts for nicer printing / testing
-        return {region: dict(cat_map) for region, cat_map in nested.items()}
+        return {
+            region: dict(cat_map)
+            for region, cat_map in self._revenue_by_region_then_category.items()
+        }
 
     def best_selling_product_by_quantity(self) -> Optional[str]:
         """
         Returns the product with the highest quantity sold.
         """
-        totals: Dict[str, int] = defaultdict(int)
-        for r in self.records:
-            totals[r.product] += r.quantity
+        totals = self._group_totals.product_quantity
 
         if not totals:
             return None
 
         # argmax over totals dict
         return max(totals.items(), key=lambda kv: kv[1])[0]
+
+    # ---------- Memoized computations ----------
+    # The analyzer owns its columns (a private snapshot or freshly built),
+    # so each result is computed at most once; public methods return copies.
+
+    @cached_property
+    def _total_revenue(self) -> float:
+        return sum(self.columns.revenue)
+
+    @cached_property
+    def _average_order_value_by_date(self) -> Dict[date, float]:
+        cols = self.columns
+
+        # (date, order_id) -> order total
+        order_totals: Dict[tuple[date, str], float] = defaultdict(float)
+        for key, rev in zip(zip(cols.date, cols.order_id), cols.revenue):
+            order_totals[key] += rev
+
+        # date -> sum and count of its order totals
+        date_sums: Dict[date, float] = defaultdict(float)
+        date_counts: Dict[date, int] = defaultdict(int)
+        for (d, _), total in order_totals.items():
+            date_sums[d] += total
+            date_counts[d] += 1
+
+        return {d: total / date_counts[d] for d, total in date_sums.items()}
+
+    @cached_property
+    def _revenue_by_region_then_category(self) -> Dict[str, Dict[str, float]]:
+        cols = self.columns
+        n_categories = len(cols.categories)
+
+        # region code * n_categories + category code -> revenue, i.e. one flat
+        # key per (region, category) pair and a single lookup per row
+        flat: Dict[int, float] = defaultdict(float)
+        for rc, cc, rev in zip(cols.region_code, cols.category_code, cols.revenue):
+            flat[rc * n_categories + cc] += rev
+
+        # reshape into region -> category, decoding codes to names
+        nested: Dict[str, Dict[str, float]] = {}
+        for key, rev in flat.items():
+            rc, cc = divmod(key, n_categories)
+            nested.setdefault(cols.regions[rc], {})[cols.categories[cc]] = rev
+        return nested
+
+    @cached_property
+    def _group_totals(self) -> _GroupTotals:
+        """
+        Fills every single-key grouping in one pass over the columns,
+        instead of one pass per aggregation method.
+        """
+        cols = self.columns
+        # Codes are dense, so plain lists indexed by code replace hashing
+        region_revenue = [0.0] * len(cols.regions)
+        product_revenue = [0.0] * len(cols.products)
+        product_quantity = [0] * len(cols.products)
+        category_quantity = [0] * len(cols.categories)
+
+        for rc, pc, cc, qty, rev in zip(
+            cols.region_code,
+            cols.product_code,
+            cols.category_code,
+            cols.quantity,
+            cols.revenue,
+        ):
+            region_revenue[rc] += rev
+            product_revenue[pc] += rev
+            product_quantity[pc] += qty
+            category_quantity[cc] += qty
+
+        return _GroupTotals(
+            region_revenue=dict(zip(cols.regions, region_revenue)),
+            product_revenue=dict(zip(cols.products, product_revenue)),
+            product_quantity=dict(zip(cols.products, product_quantity)),
+            category_quantity=dict(zip(cols.categories, category_quantity)),
+        )
+
+
+class StreamingAnalyzer(SalesDataAnalyzer):
+    """
+    Analyzer backed by a CSV file instead of in-memory records.
+    Single-pass reductions stream the file; the columns are only
+    loaded when a method that needs them is first called.
+
+    __init__ deliberately does not call super().__init__, since that would
+    load the columns eagerly. Instead the base class's columns instance
+    attribute is replaced by a cached_property that reads the file on
+    first access.
+    """
+
+    def __init__(self, csv_path: Path) -> None:
+        self.csv_path = csv_path
+
+    @classmethod
+    def from_csv(cls, csv_path: Path) -> StreamingAnalyzer:
+        """
+        Build a streaming analyzer for a CSV file.
+        Nothing is read until a method needs the data.
+        """
+        return cls(csv_path)
+
+    @cached_property
+    def columns(self) -> SalesColumns:
+        return load_sales_columns(self.csv_path)
+
+    def _iter(self) -> Iterator[_SalesRow]:
+        return _read_sales_rows(self.csv_path)
+
+    @cached_property
+    def _total_revenue(self) -> float:
+        # Stream the file unless the columns are already loaded
+        if "columns" in self.__dict__:
+            return sum(self.columns.revenue)
+        return sum(quantity * unit_price for *_, quantity, unit_price in self._iter())
@@ -3,7 +3,7 @@
 from __future__ import annotations
 from pathlib import Path
 
-from .data_analyzer import load_sales, SalesDataAnalyzer
+from .data_analyzer import SalesDataAnalyzer
 
 
 def main() -> None:
@@ -11,8 +11,7 @@ def main() -> None:
     base_dir = Path(__file__).resolve().parent
     csv_path = base_dir / "data" / "sales.csv"
 
-    records = load_sales(csv_path)
-    analyzer = SalesDataAnalyzer(records)
+    analyzer = SalesDataAnalyzer.from_csv(csv_path)
 
     # 1. Total revenue
     print(f"Total revenue: {analyzer.total_revenue():.2f}\n")
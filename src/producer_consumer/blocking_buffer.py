@@ -1,10 +1,14 @@
 import threading
+from collections import deque
+
+# Default for take_many(stop_at=...): never matches a real item
+NO_STOP = object()
 
 
 class BlockingBuffer:
     """
     A thread-safe bounded buffer implementing blocking put() and take()
-    using a Condition variable. Demonstrates:
+    using two Condition variables that share one lock. Demonstrates:
     - thread synchronization
     - wait/notify
     - concurrent access protection
@@ -15,37 +19,122 @@ class BlockingBuffer:
         if capacity <= 0:
             raise ValueError("Capacity must be positive")
         self.capacity = capacity
-        self.buffer = []
-        self.condition = threading.Condition()
+        # deque gives O(1) popleft; blocking on capacity is done by put(), not maxlen
+        self.buffer = deque()
+        # Producers wait on not_full and consumers on not_empty, so each
+        # side only wakes the other instead of every waiting thread
+        self.lock = threading.Lock()
+        self.not_full = threading.Condition(self.lock)
+        self.not_empty = threading.Condition(self.lock)
+        # Number of threads currently blocked on each condition, so the
+        # uncontended path can skip notify() entirely
+        self._waiting_producers = 0
+        self._waiting_consumers = 0
+
+    def _wait_not_full(self):
+        """
+        Block until there is free space. The caller must hold the lock.
+        """
+        while len(self.buffer) >= self.capacity:
+            self._waiting_producers += 1
+            try:
+                self.not_full.wait()
+            finally:
+                self._waiting_producers -= 1
+
+    def _wait_not_empty(self):
+        """
+        Block until there is an item. The caller must hold the lock.
+        """
+        while len(self.buffer) == 0:
+            self._waiting_consumers += 1
+            try:
+                self.not_empty.wait()
+            finally:
+                self._waiting_consumers -= 1
 
     def put(self, item):
         """
         Put an item into the buffer.
         Blocks if the buffer is full.
         """
-        with self.condition:
+        with self.not_full:
             # Wait if buffer is full
-            while len(self.buffer) >= self.capacity:
-                self.condition.wait()
+            self._wait_not_full()
 
             self.buffer.append(item)
 
             # Notify a waiting consumer that an item is available
-            self.condition.notify_all()
+            if self._waiting_consumers:
+                self.not_empty.notify()
 
     def take(self):
         """
         Take an item from the buffer.
         Blocks if the buffer is empty.
         """
-        with self.condition:
+        with self.not_empty:
             # Wait if buffer is empty
-            while len(self.buffer) == 0:
-                self.condition.wait()
+            self._wait_not_empty()
 
-            item = self.buffer.pop(0)
+            item = self.buffer.popleft()
 
             # Notify a waiting producer that space is free
-            self.condition.notify_all()
+            if self._waiting_producers:
+                self.not_full.notify()
 
             return item
+
+    def put_many(self, items):
+        """
+        Put several items into the buffer, in order.
+        Blocks whenever the buffer is full until all items are placed.
+        """
+        items = list(items)
+        start = 0
+
+        with self.not_full:
+            while start < len(items):
+                # Wait if buffer is full
+                self._wait_not_full()
+
+                # Move as many items as currently fit in one step
+                end = min(len(items), start + self.capacity - len(self.buffer))
+                self.buffer.extend(items[start:end])
+
+                # Wake one consumer per item added; this must happen before
+                # waiting for space again or a full buffer would never drain
+                if self._waiting_consumers:
+                    self.not_empty.notify(end - start)
+                start = end
+
+    def take_many(self, max_n, stop_at=NO_STOP):
+        """
+        Take up to max_n items from the buffer, in order.
+        Blocks if the buffer is empty, then returns whatever is available.
+        If an item that is stop_at (e.g. a poison pill) is taken, it is the
+        last item returned and everything after it stays in the buffer.
+        """
+        if max_n <= 0:
+            raise ValueError("max_n must be positive")
+
+        with self.not_empty:
+            # Wait if buffer is empty
+            self._wait_not_empty()
+
+            items = []
+            while len(items) < max_n and self.buffer:
+                item = self.buffer.popleft()
+                items.append(item)
+                if item is stop_at:
+                    break
+
+            # Notify waiting producers that space is free
+            if self._waiting_producers:
+                self.not_full.notify(len(items))
+
+            # Wake another consumer for whatever was left behind the stop item
+            if self.buffer and self._waiting_consumers:
+                self.not_empty.notify()
+
+            return items
@@ -0,0 +1,49 @@
+import queue
+
+from .blocking_buffer import NO_STOP
+
+
+class FastBuffer:
+    """
+    An unbounded thread-safe buffer backed by queue.SimpleQueue.
+    The queue is implemented in C, so put() and take() avoid the
+    Python-level Condition handling of BlockingBuffer. Use it when
+    the producer never needs to be throttled by a capacity limit.
+    """
+
+    def __init__(self):
+        self.queue = queue.SimpleQueue()
+        # Bind the C methods directly to skip a Python call frame per item
+        self.put = self.queue.put
+        self.take = self.queue.get
+
+    def put_many(self, items):
+        """
+        Put several items into the buffer, in order.
+        Never blocks since the buffer is unbounded.
+        """
+        put = self.queue.put
+        for item in items:
+            put(item)
+
+    def take_many(self, max_n, stop_at=NO_STOP):
+        """
+        Take up to max_n items from the buffer, in order.
+        Blocks if the buffer is empty, then returns whatever is available.
+        If an item that is stop_at (e.g. a poison pill) is taken, it is the
+        last item returned and everything after it stays in the buffer.
+        """
+        if max_n <= 0:
+            raise ValueError("max_n must be positive")
+
+        item = self.queue.get()
+        items = [item]
+        get_nowait = self.queue.get_nowait
+        try:
+            while len(items) < max_n and item is not stop_at:
+                item = get_nowait()
+                items.append(item)
+        except queue.Empty:
+            pass
+
+        return items
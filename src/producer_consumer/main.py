@@ -1,18 +1,23 @@
 from .blocking_buffer import BlockingBuffer
+from .fast_buffer import FastBuffer
 from .producer_consumer import Producer, Consumer
 
 
-def main():
+def main(capacity=2):
     # Example data to be processed
     source = [1, 2, 3, 4, 5]
     destination = []
     poison_pill = object()
 
-    buffer = BlockingBuffer(capacity=2)
+    # Pass capacity=None to use the unbounded FastBuffer instead
+    if capacity is None:
+        buffer = FastBuffer()
+    else:
+        buffer = BlockingBuffer(capacity=capacity)
 
     # Create producer and consumer threads
-    producer = Producer(source, buffer, poison_pill)
-    consumer = Consumer(buffer, destination, poison_pill)
+    producer = Producer(source, buffer, poison_pill, work_delay=0.0)
+    consumer = Consumer(buffer, destination, poison_pill, work_delay=0.0)
 
     producer.start()
     consumer.start()
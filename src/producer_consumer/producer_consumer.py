@@ -1,5 +1,6 @@
 import threading
 import time
+from itertools import islice
 from .blocking_buffer import BlockingBuffer
 
 
@@ -9,17 +10,35 @@ class Producer(threading.Thread):
     Reads from a source list and pushes items into the blocking buffer.
     """
 
-    def __init__(self, source, buffer, poison_pill):
+    def __init__(self, source, buffer, poison_pill, batch_size=10, work_delay=0.0):
         super().__init__()
+        # Ensure batch size is positive
+        if batch_size <= 0:
+            raise ValueError("Batch size must be positive")
         self.source = source
         self.buffer = buffer
         self.poison_pill = poison_pill
+        self.batch_size = batch_size
+        # Seconds of simulated work per item; 0 disables the pause
+        self.work_delay = work_delay
 
     def run(self):
-        for item in self.source:
-            print(f"[Producer] Producing {item}")
-            self.buffer.put(item)
-            time.sleep(0.1)  # Pause to simulate work
+        items = iter(self.source)
+        while True:
+            # Read the source in batch_size slices so it may be lazy or
+            # unbounded; each slice is handed over under one lock acquisition
+            chunk = list(islice(items, self.batch_size))
+            if not chunk:
+                break
+
+            for item in chunk:
+                print(f"[Producer] Producing {item}")
+            self.buffer.put_many(chunk)
+
+            # Pause to simulate work for each item just handed over, so the
+            # consumer can already process them in the meantime
+            if self.work_delay > 0:
+                time.sleep(self.work_delay * len(chunk))
 
         # Send poison pill to stop the consumer
         self.buffer.put(self.poison_pill)
@@ -32,20 +51,28 @@ class Consumer(threading.Thread):
     Reads from the blocking buffer and processes items into a destination list.
     """
 
-    def __init__(self, buffer, destination, poison_pill):
+    def __init__(self, buffer, destination, poison_pill, batch_size=10, work_delay=0.0):
         super().__init__()
+        # Ensure batch size is positive
+        if batch_size <= 0:
+            raise ValueError("Batch size must be positive")
         self.buffer = buffer
         self.destination = destination
         self.poison_pill = poison_pill
+        self.batch_size = batch_size
+        # Seconds of simulated work per item; 0 disables the pause
+        self.work_delay = work_delay
 
     def run(self):
         while True:
-            item = self.buffer.take()
-
-            if item is self.poison_pill:
-                print("[Consumer] Received poison pill. Stopping.")
-                break
+            # Drain up to batch_size items per lock acquisition, never past
+            # a poison pill so items and pills behind it stay for other consumers
+            for item in self.buffer.take_many(self.batch_size, stop_at=self.poison_pill):
+                if item is self.poison_pill:
+                    print("[Consumer] Received poison pill. Stopping.")
+                    return
 
-            print(f"[Consumer] Consuming {item}")
-            self.destination.append(item)
-            time.sleep(0.2)  # Simulate work
+                print(f"[Consumer] Consuming {item}")
+                self.destination.append(item)
+                if self.work_delay > 0:
+                    time.sleep(self.work_delay)  # Simulate work
@@ -1,13 +1,17 @@
 import csv
+from dataclasses import FrozenInstanceError
 from datetime import date
 from pathlib import Path
 
 import pytest
 
 from data_analysis.data_analyzer import (
+    SalesColumns,
     SalesRecord,
     SalesDataAnalyzer,
+    StreamingAnalyzer,
     load_sales,
+    load_sales_columns,
 )
 
 
@@ -67,8 +71,102 @@ def sample_records():
     ]
 
 
+def write_csv(tmp_path: Path, rows) -> Path:
+    """
+    Write rows (header first) to a CSV file under tmp_path and return its path.
+    """
+    csv_file = tmp_path / "sales_data.csv"
+
+    with csv_file.open("w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerows(rows)
+
+    return csv_file
+
+
+# ---------- Tests for SalesRecord ----------
+
+def test_record_line_revenue_is_precomputed_and_immutable():
+    record = sample_records()[0]
+
+    assert record.line_revenue == pytest.approx(2000.0)
+    assert not hasattr(record, "__dict__")
+
+    with pytest.raises(FrozenInstanceError):
+        record.quantity = 3
+
+
+# ---------- Tests for SalesColumns ----------
+
+def test_columns_from_records():
+    cols = SalesColumns.from_records(sample_records())
+
+    assert cols.order_id == ["O-001", "O-002", "O-003", "O-003"]
+    assert cols.regions == ["North", "South"]
+    assert cols.region_code == [0, 0, 1, 1]
+    assert cols.products == ["Laptop", "Mouse"]
+    assert cols.product_code == [0, 1, 0, 1]
+    assert cols.quantity == [2, 5, 1, 2]
+    assert cols.revenue == pytest.approx([2000.0, 100.0, 1100.0, 50.0])
+
+
+def test_columns_constructed_directly_reuse_existing_codes():
+    cols = SalesColumns(
+        order_id=["O-001"],
+        date=[date(2024, 1, 1)],
+        region_code=[0],
+        product_code=[0],
+        category_code=[0],
+        quantity=[1],
+        unit_price=[2.0],
+        revenue=[2.0],
+        regions=["North"],
+        products=["Laptop"],
+        categories=["Electronics"],
+    )
+
+    cols.append("O-002", date(2024, 1, 2), "North", "Laptop", "Electronics", 1, 2.0)
+
+    assert cols.regions == ["North"]
+    assert cols.region_code == [0, 0]
+    assert SalesDataAnalyzer(cols).revenue_by_region() == pytest.approx({"North": 4.0})
+
+
+def test_columns_reject_inconsistent_input():
+    with pytest.raises(ValueError):
+        SalesColumns(regions=["North", "North"])
+
+    with pytest.raises(ValueError):
+        SalesColumns(order_id=["O-001"])
+
+    with pytest.raises(ValueError):
+        SalesColumns(
+            order_id=["O-001"],
+            date=[date(2024, 1, 1)],
+            region_code=[1],
+            product_code=[0],
+            category_code=[0],
+            quantity=[1],
+            unit_price=[2.0],
+            revenue=[2.0],
+            regions=["North"],
+            products=["Laptop"],
+            categories=["Electronics"],
+        )
+
+
 # ---------- Tests for SalesDataAnalyzer ----------
 
+def test_records_are_rebuilt_lazily():
+    records = sample_records()
+    analyzer = SalesDataAnalyzer(records)
+
+    # Not materialized until first access
+    assert "records" not in analyzer.__dict__
+    assert analyzer.records == records
+    assert analyzer.records is analyzer.records
+
+
 def test_total_revenue():
     records = sample_records()
     analyzer = SalesDataAnalyzer(records)
@@ -143,6 +241,18 @@ def test_top_n_products_by_revenue():
     product_names = [name for name, _ in top2]
     assert product_names == ["Laptop", "Mouse"]
 
+    # asking for more products than exist returns them all, still ordered
+    assert [name for name, _ in analyzer.top_n_products_by_revenue(5)] == ["Laptop", "Mouse"]
+
+
+def test_top_n_products_by_revenue_rejects_negative_n():
+    analyzer = SalesDataAnalyzer(sample_records())
+
+    assert analyzer.top_n_products_by_revenue(0) == []
+
+    with pytest.raises(ValueError):
+        analyzer.top_n_products_by_revenue(-1)
+
 
 def test_revenue_by_region_then_category():
     records = sample_records()
@@ -168,12 +278,37 @@ def test_best_selling_product_by_quantity():
     assert analyzer.best_selling_product_by_quantity() == "Mouse"
 
 
+def test_grouped_results_are_independent_copies():
+    analyzer = SalesDataAnalyzer(sample_records())
+
+    # Results share one cached pass, so callers must not be able to corrupt it
+    analyzer.revenue_by_product()["Laptop"] = 0.0
+    analyzer.quantity_by_category().clear()
+
+    assert analyzer.revenue_by_product()["Laptop"] == pytest.approx(3100.0)
+    assert analyzer.quantity_by_category() == {"Electronics": 3, "Accessories": 7}
+
+    analyzer.average_order_value_by_date().clear()
+    analyzer.revenue_by_region_then_category()["North"]["Electronics"] = 0.0
+
+    assert analyzer.average_order_value_by_date()[date(2024, 1, 1)] == pytest.approx(1050.0)
+    assert analyzer.revenue_by_region_then_category()["North"]["Electronics"] == pytest.approx(
+        2000.0
+    )
+
+
 def test_best_selling_product_none_for_empty():
     analyzer = SalesDataAnalyzer([])
 
     assert analyzer.best_selling_product_by_quantity() is None
 
 
+def test_revenue_by_region_then_category_empty():
+    analyzer = SalesDataAnalyzer([])
+
+    assert analyzer.revenue_by_region_then_category() == {}
+
+
 def test_average_order_value_empty():
     analyzer = SalesDataAnalyzer([])
 
@@ -191,8 +326,6 @@ def test_load_sales_reads_valid_rows_and_skips_invalid(tmp_path: Path):
       - load_sales returns 2 records
       - values parsed correctly
     """
-    csv_file = tmp_path / "sales_data.csv"
-
     rows = [
         ["order_id", "date", "region", "product", "category", "quantity", "unit_price"],
         ["O-001", "2024-01-01", "North", "Laptop", "Electronics", "2", "1000.0"],
@@ -201,9 +334,7 @@ def test_load_sales_reads_valid_rows_and_skips_invalid(tmp_path: Path):
         ["O-003", "2024-01-03", "West", "Keyboard", "Accessories", "", "45.0"],
     ]
 
-    with csv_file.open("w", newline="") as f:
-        writer = csv.writer(f)
-        writer.writerows(rows)
+    csv_file = write_csv(tmp_path, rows)
 
     records = load_sales(csv_file)
 
@@ -216,3 +347,156 @@ def test_load_sales_reads_valid_rows_and_skips_invalid(tmp_path: Path):
     assert first.quantity == 2
     assert first.unit_price == pytest.approx(1000.0)
     assert first.line_revenue == pytest.approx(2000.0)
+
+    second = next(records)
+    assert second.order_id == "O-002"
+
+    # the malformed row is skipped, so the stream ends here
+    with pytest.raises(StopIteration):
+        next(records)
+
+
+def test_load_sales_logs_skipped_rows(tmp_path: Path, caplog):
+    rows = [
+        ["order_id", "date", "region", "product", "category", "quantity", "unit_price"],
+        ["O-001", "not-a-date", "North", "Laptop", "Electronics", "2", "1000.0"],
+    ]
+
+    csv_file = write_csv(tmp_path, rows)
+
+    with caplog.at_level("WARNING"):
+        assert list(load_sales(csv_file)) == []
+
+    assert "Skipping malformed row" in caplog.text
+
+
+def test_load_sales_skips_short_rows_and_reorders_columns(tmp_path: Path):
+    """
+    Columns are picked by header name, so their order in the file does not
+    matter. Rows with missing fields are skipped.
+    """
+    rows = [
+        ["date", "order_id", "unit_price", "quantity", "category", "product", "region"],
+        ["2024-01-01", "O-001", "1000.0", "2", "Electronics", "Laptop", "North"],
+        ["2024-01-02", "O-002"],
+    ]
+
+    csv_file = write_csv(tmp_path, rows)
+
+    records = list(load_sales(csv_file))
+
+    assert len(records) == 1
+    assert records[0].order_id == "O-001"
+    assert records[0].region == "North"
+    assert records[0].line_revenue == pytest.approx(2000.0)
+
+
+def test_load_sales_skips_blank_lines_silently(tmp_path: Path, caplog):
+    csv_file = tmp_path / "sales_data.csv"
+    csv_file.write_text(
+        "order_id,date,region,product,category,quantity,unit_price\n"
+        "O-001,2024-01-01,North,Laptop,Electronics,2,1000.0\n"
+        "\n"
+        "O-002,2024-01-02,South,Mouse,Accessories,5,20.0\n"
+        "\n"
+    )
+
+    with caplog.at_level("WARNING"):
+        records = list(load_sales(csv_file))
+
+    assert [r.order_id for r in records] == ["O-001", "O-002"]
+    assert "Skipping malformed row" not in caplog.text
+
+
+def test_load_sales_rejects_header_missing_columns(tmp_path: Path):
+    rows = [
+        ["order_id", "date", "region", "product", "quantity"],
+        ["O-001", "2024-01-01", "North", "Laptop", "2"],
+    ]
+
+    csv_file = write_csv(tmp_path, rows)
+
+    with pytest.raises(ValueError, match="category, unit_price"):
+        list(load_sales(csv_file))
+
+
+def test_analyzer_from_csv(tmp_path: Path):
+    rows = [
+        ["order_id", "date", "region", "product", "category", "quantity", "unit_price"],
+        ["O-001", "2024-01-01", "North", "Laptop", "Electronics", "2", "1000.0"],
+        ["O-002", "2024-01-02", "South", "Mouse", "Accessories", "5", "20.0"],
+    ]
+
+    csv_file = write_csv(tmp_path, rows)
+
+    analyzer = SalesDataAnalyzer.from_csv(csv_file)
+
+    assert analyzer.total_revenue() == pytest.approx(2100.0)
+    assert analyzer.revenue_by_region() == pytest.approx({"North": 2000.0, "South": 100.0})
+
+
+def test_load_sales_columns_matches_load_sales(tmp_path: Path):
+    rows = [
+        ["order_id", "date", "region", "product", "category", "quantity", "unit_price"],
+        ["O-001", "2024-01-01", "North", "Laptop", "Electronics", "2", "1000.0"],
+        ["O-002", "2024-01-02", "South", "Mouse", "Accessories", "5", "20.0"],
+        ["O-003", "2024-01-03", "West", "Keyboard", "Accessories", "", "45.0"],
+    ]
+
+    csv_file = write_csv(tmp_path, rows)
+
+    cols = load_sales_columns(csv_file)
+
+    assert cols == SalesColumns.from_records(load_sales(csv_file))
+    assert SalesDataAnalyzer(cols).columns == cols
+
+
+def test_analyzer_snapshots_columns_passed_in():
+    cols = SalesColumns.from_records(sample_records())
+    analyzer = SalesDataAnalyzer(cols)
+
+    assert analyzer.total_revenue() == pytest.approx(3250.0)
+
+    # Appending to the caller's columns must not affect any result
+    cols.append("O-004", date(2024, 1, 3), "West", "Laptop", "Electronics", 1, 500.0)
+
+    assert analyzer.columns is not cols
+    assert analyzer.total_revenue() == pytest.approx(3250.0)
+    assert set(analyzer.revenue_by_region()) == {"North", "South"}
+
+
+def test_load_sales_interns_categorical_strings(tmp_path: Path):
+    rows = [
+        ["order_id", "date", "region", "product", "category", "quantity", "unit_price"],
+        ["O-001", "2024-01-01", "North", "Laptop", "Electronics", "2", "1000.0"],
+        ["O-002", "2024-01-02", "North", "Laptop", "Electronics", "1", "1000.0"],
+    ]
+
+    csv_file = write_csv(tmp_path, rows)
+
+    first, second = load_sales(csv_file)
+
+    assert first.region is second.region
+    assert first.product is second.product
+    assert first.category is second.category
+
+
+def test_streaming_analyzer_loads_columns_lazily(tmp_path: Path):
+    rows = [
+        ["order_id", "date", "region", "product", "category", "quantity", "unit_price"],
+        ["O-001", "2024-01-01", "North", "Laptop", "Electronics", "2", "1000.0"],
+        ["O-002", "2024-01-02", "South", "Mouse", "Accessories", "5", "20.0"],
+    ]
+
+    csv_file = write_csv(tmp_path, rows)
+
+    analyzer = StreamingAnalyzer.from_csv(csv_file)
+
+    # total_revenue is a single pass over the file, no columns needed
+    assert analyzer.total_revenue() == pytest.approx(2100.0)
+    assert "columns" not in analyzer.__dict__
+
+    # grouping methods load the columns once on first use
+    assert analyzer.revenue_by_region() == pytest.approx({"North": 2000.0, "South": 100.0})
+    assert "columns" in analyzer.__dict__
+    assert analyzer.total_revenue() == pytest.approx(2100.0)
@@ -1,8 +1,11 @@
 import threading
 import time
+from unittest.mock import patch
+
 import pytest
 
 from producer_consumer.blocking_buffer import BlockingBuffer
+from producer_consumer.fast_buffer import FastBuffer
 from producer_consumer.producer_consumer import Producer, Consumer
 
 
@@ -80,6 +83,25 @@ def test_put_blocks_when_full():
     assert buffer.take() == "second"
 
 
+def test_uncontended_put_and_take_skip_notify():
+    """
+    With no thread waiting on the other side, put() and take() should not
+    call notify() at all.
+    """
+    buffer = BlockingBuffer(capacity=2)
+
+    with patch.object(buffer.not_empty, "notify") as notify_consumers, patch.object(
+        buffer.not_full, "notify"
+    ) as notify_producers:
+        buffer.put(1)
+        buffer.put_many([2])
+        assert buffer.take() == 1
+        assert buffer.take_many(1) == [2]
+
+    notify_consumers.assert_not_called()
+    notify_producers.assert_not_called()
+
+
 def test_take_blocks_when_empty_until_put():
     """
     Start a thread that calls take() on an empty buffer.
@@ -110,8 +132,194 @@ def test_take_blocks_when_empty_until_put():
     assert results == ["value"]
 
 
+def test_put_many_and_take_many():
+    """
+    Bulk operations keep FIFO order and take_many returns at most max_n items.
+    """
+    buffer = BlockingBuffer(capacity=5)
+
+    buffer.put_many([1, 2, 3, 4])
+
+    assert buffer.take_many(3) == [1, 2, 3]
+    assert buffer.take_many(3) == [4]
+
+
+def test_take_many_stops_at_sentinel():
+    """
+    take_many should return the stop_at item last and leave the rest queued.
+    """
+    buffer = BlockingBuffer(capacity=10)
+    pill = object()
+
+    buffer.put_many([1, 2, pill, 3, pill])
+
+    assert buffer.take_many(10, stop_at=pill) == [1, 2, pill]
+    assert buffer.take_many(10, stop_at=pill) == [3, pill]
+
+
+def test_take_many_rejects_non_positive_max_n():
+    buffer = BlockingBuffer(capacity=2)
+
+    with pytest.raises(ValueError):
+        buffer.take_many(0)
+
+
+def test_put_many_blocks_until_all_items_fit():
+    """
+    put_many with more items than capacity should fill the buffer, block,
+    and resume as a consumer frees space.
+    """
+    buffer = BlockingBuffer(capacity=2)
+    put_completed = threading.Event()
+
+    def producer_task():
+        buffer.put_many(range(5))
+        put_completed.set()
+
+    t = threading.Thread(target=producer_task)
+    t.start()
+
+    # Only the first two items fit, so put_many should be blocked
+    time.sleep(0.1)
+    assert not put_completed.is_set()
+
+    results = []
+    while len(results) < 5:
+        results.extend(buffer.take_many(5))
+
+    t.join(timeout=1.0)
+    assert not t.is_alive()
+    assert results == [0, 1, 2, 3, 4]
+
+
+def test_many_producers_and_consumers_transfer_everything():
+    """
+    Several producers and consumers share a small buffer. Every item
+    should arrive exactly once and no thread should be left blocked.
+    """
+    buffer = BlockingBuffer(capacity=2)
+    per_producer = 200
+    results = []
+    results_lock = threading.Lock()
+
+    def producer_task(offset):
+        for i in range(per_producer):
+            buffer.put(offset + i)
+
+    def consumer_task():
+        for _ in range(per_producer):
+            item = buffer.take()
+            with results_lock:
+                results.append(item)
+
+    threads = [threading.Thread(target=producer_task, args=(n * per_producer,)) for n in range(4)]
+    threads += [threading.Thread(target=consumer_task) for _ in range(4)]
+
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(timeout=5.0)
+
+    assert not any(t.is_alive() for t in threads)
+    assert sorted(results) == list(range(4 * per_producer))
+
+
+# ---------- FastBuffer Tests ----------
+
+def test_fast_buffer_is_fifo():
+    buffer = FastBuffer()
+
+    buffer.put("a")
+    buffer.put_many(["b", "c", "d"])
+
+    assert buffer.take() == "a"
+    assert buffer.take_many(2) == ["b", "c"]
+    assert buffer.take_many(5) == ["d"]
+
+
+def test_fast_buffer_take_many_stops_at_sentinel():
+    buffer = FastBuffer()
+    pill = object()
+
+    buffer.put_many([1, pill, 2])
+
+    assert buffer.take_many(10, stop_at=pill) == [1, pill]
+    assert buffer.take_many(10, stop_at=pill) == [2]
+
+
+def test_fast_buffer_take_blocks_when_empty_until_put():
+    buffer = FastBuffer()
+    results = []
+
+    t = threading.Thread(target=lambda: results.append(buffer.take_many(3)))
+    t.start()
+
+    # Give the thread a moment, the take should be blocked
+    time.sleep(0.1)
+    assert results == []
+
+    buffer.put("value")
+
+    t.join(timeout=1.0)
+    assert not t.is_alive()
+    assert results == [["value"]]
+
+
+def test_fast_buffer_take_many_rejects_non_positive_max_n():
+    with pytest.raises(ValueError):
+        FastBuffer().take_many(0)
+
+
 # ---------- Producer–Consumer integration tests ----------
 
+def test_invalid_batch_size_raises():
+    """
+    Check invalid batch sizes raise ValueError before any thread starts.
+    """
+    buffer = BlockingBuffer(capacity=2)
+    poison_pill = object()
+
+    with pytest.raises(ValueError):
+        Producer(source=[], buffer=buffer, poison_pill=poison_pill, batch_size=0)
+
+    with pytest.raises(ValueError):
+        Consumer(buffer=buffer, destination=[], poison_pill=poison_pill, batch_size=0)
+
+
+def test_producer_streams_lazy_source():
+    """
+    The producer should read the source in batch_size slices as the buffer
+    accepts them, not consume the whole source before putting anything.
+    """
+    read = []
+
+    def numbers():
+        for i in range(10_000):
+            read.append(i)
+            yield i
+
+    buffer = BlockingBuffer(capacity=3)
+    poison_pill = object()
+    producer = Producer(source=numbers(), buffer=buffer, poison_pill=poison_pill, batch_size=10)
+    producer.start()
+
+    assert buffer.take_many(3) == [0, 1, 2]
+    # Only the first slice has been read; it cannot all fit in the buffer yet
+    assert len(read) == 10
+
+    # Drain to the pill so the producer finishes
+    received = [0, 1, 2]
+    while True:
+        item = buffer.take()
+        if item is poison_pill:
+            break
+        received.append(item)
+
+    producer.join(timeout=2.0)
+    assert not producer.is_alive()
+    assert received == list(range(10_000))
+
+
 def test_all_items_transferred_in_order():
     """
     Producer should move all items from source to buffer,
@@ -215,3 +423,137 @@ def test_non_integer_items():
     # Check that all Dummy objects arrived with correct values
     assert len(destination) == len(source)
     assert [d.value for d in destination] == [s.value for s in source]
+
+
+def test_work_delay_still_transfers_all_items():
+    """
+    A non-zero work delay slows the pipeline down but must not change results.
+    """
+    source = [1, 2, 3]
+    destination = []
+
+    buffer = BlockingBuffer(capacity=2)
+    poison_pill = object()
+
+    producer = Producer(source=source, buffer=buffer, poison_pill=poison_pill, work_delay=0.01)
+    consumer = Consumer(
+        buffer=buffer, destination=destination, poison_pill=poison_pill, work_delay=0.01
+    )
+
+    producer.start()
+    consumer.start()
+
+    producer.join(timeout=2.0)
+    consumer.join(timeout=2.0)
+
+    assert not producer.is_alive()
+    assert not consumer.is_alive()
+    assert destination == source
+
+
+def test_pipeline_with_fast_buffer():
+    source = list(range(100))
+    destination = []
+
+    buffer = FastBuffer()
+    poison_pill = object()
+
+    producer = Producer(source=source, buffer=buffer, poison_pill=poison_pill)
+    consumer = Consumer(buffer=buffer, destination=destination, poison_pill=poison_pill)
+
+    producer.start()
+    consumer.start()
+
+    producer.join(timeout=2.0)
+    consumer.join(timeout=2.0)
+
+    assert not producer.is_alive()
+    assert not consumer.is_alive()
+    assert destination == source
+
+
+def test_producer_work_delay_overlaps_with_consumer():
+    """
+    Items should reach the consumer as they are produced, not only after the
+    producer has finished all of its simulated work.
+    """
+    buffer = BlockingBuffer(capacity=2)
+    poison_pill = object()
+
+    producer = Producer(
+        source=[1, 2, 3, 4, 5], buffer=buffer, poison_pill=poison_pill, work_delay=0.1
+    )
+
+    start = time.monotonic()
+    producer.start()
+    first = buffer.take()
+    elapsed = time.monotonic() - start
+
+    # Drain the rest so the producer can finish
+    while buffer.take() is not poison_pill:
+        pass
+    producer.join(timeout=2.0)
+
+    assert first == 1
+    assert elapsed < 0.2
+
+
+@pytest.mark.parametrize("make_buffer", [lambda: BlockingBuffer(capacity=10), FastBuffer])
+def test_consumers_leave_items_behind_a_poison_pill(make_buffer):
+    """
+    Two producers each send their items and a poison pill before any consumer
+    starts, so the first consumer's batch could span both pills. Each consumer
+    must stop at its own pill without dropping what follows it.
+    """
+    buffer = make_buffer()
+    poison_pill = object()
+
+    producers = [
+        Producer(source=source, buffer=buffer, poison_pill=poison_pill)
+        for source in ([1, 2], [3, 4])
+    ]
+    for producer in producers:
+        producer.start()
+    for producer in producers:
+        producer.join(timeout=2.0)
+
+    destinations = [[], []]
+    consumers = [
+        Consumer(buffer=buffer, destination=destination, poison_pill=poison_pill)
+        for destination in destinations
+    ]
+    for consumer in consumers:
+        consumer.start()
+    for consumer in consumers:
+        consumer.join(timeout=2.0)
+
+    assert not any(c.is_alive() for c in consumers)
+    assert sorted(destinations[0] + destinations[1]) == [1, 2, 3, 4]
+
+
+def test_many_producer_and_consumer_threads_transfer_everything():
+    """
+    Several Producer and Consumer threads run concurrently on one small
+    buffer; every item arrives exactly once and every thread finishes.
+    """
+    buffer = BlockingBuffer(capacity=4)
+    poison_pill = object()
+    sources = [list(range(n * 100, (n + 1) * 100)) for n in range(4)]
+    destinations = [[] for _ in sources]
+
+    threads = [
+        Producer(source=source, buffer=buffer, poison_pill=poison_pill, batch_size=3)
+        for source in sources
+    ]
+    threads += [
+        Consumer(buffer=buffer, destination=destination, poison_pill=poison_pill, batch_size=3)
+        for destination in destinations
+    ]
+
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(timeout=5.0)
+
+    assert not any(t.is_alive() for t in threads)
+    assert sorted(sum(destinations, [])) == list(range(400))